@@ -0,0 +1,199 @@
+# liffile/setup.py
+
+"""Liffile package Setuptools script."""
+
+import json
+import os
+import re
+import sys
+import textwrap
+
+from setuptools import Extension, setup
+
+buildnumber = ''
+
+VERSION_RE = re.compile(r"__version__ = '(.*?)'")
+
+# doctest example up to the end of its paragraph
+DOCTEST_RE = re.compile(r'^>>> .*(?:\n[ \t]*\S.*)*', re.MULTILINE)
+
+
+def search(pattern: re.Pattern[str], string: str) -> str:
+    """Return first match of compiled pattern in string."""
+    match = pattern.search(string)
+    if match is None:
+        raise ValueError(f'{pattern.pattern!r} not found')
+    return match.groups()[0]
+
+
+def between(string: str, start: str, end: str, /) -> str:
+    """Return substring between start marker and following end marker."""
+    i = string.find(start)
+    if i < 0:
+        raise ValueError(f'{start!r} not found')
+    i += len(start)
+    j = string.find(end, i)
+    if j < 0:
+        raise ValueError(f'{end!r} not found')
+    return string[i:j]
+
+
+def ext_modules() -> list[Extension]:
+    """Return extension modules, which are currently not built."""
+    return [
+        Extension(
+            'liffile._liffile',
+            ['liffile/_liffile.pyx'],
+            define_macros=[
+                # ('CYTHON_TRACE_NOGIL', '1'),
+                # ('CYTHON_LIMITED_API', '1'),
+                # ('Py_LIMITED_API', '1'),
+                ('NPY_NO_DEPRECATED_API', 'NPY_1_7_API_VERSION'),
+            ],
+        )
+    ]
+
+
+def isnewer(filename: str, source: str, /) -> bool:
+    """Return whether file exists and was modified after source file."""
+    try:
+        return os.stat(filename).st_mtime_ns >= os.stat(source).st_mtime_ns
+    except OSError:
+        return False
+
+
+def write_file(filename: str, content: str, /) -> None:
+    """Write content to text file unless file already has that content."""
+    try:
+        with open(filename, encoding='utf-8') as fh:
+            if fh.read() == content:
+                return
+    except OSError:
+        pass
+    with open(filename, 'w', encoding='utf-8', newline='\n') as fh:
+        fh.write(content)
+
+
+def fix_docstring_examples(docstring: str) -> str:
+    """Return docstring with examples fixed for GitHub."""
+    docstring = '\n'.join(docstring.splitlines())  # normalize line endings
+    return '..\n  This file is generated by setup.py\n\n' + DOCTEST_RE.sub(
+        lambda match: '.. code-block:: python\n\n'
+        + textwrap.indent(match.group(0), '    '),
+        docstring,
+    )
+
+
+stat = os.stat('liffile/liffile.py')
+cachekey = [stat.st_mtime_ns, stat.st_size]
+try:
+    with open('.setup-cache.json', encoding='utf-8') as fh:
+        cache = json.load(fh)
+except (OSError, ValueError):
+    cache = {}
+
+if cache.get('key') == cachekey and 'sdist' not in sys.argv:
+    version = cache['version']
+    description = cache['description']
+else:
+    # sdist always parses the source code
+    with open('liffile/liffile.py', encoding='utf-8') as fh:
+        # metadata is located at the top of the module, before __version__
+        code = fh.read(65536)
+        if VERSION_RE.search(code) is None:
+            code += fh.read()
+
+    version = search(VERSION_RE, code)
+    # first line of module docstring
+    description = between(code, '"""', '\n').rstrip().removesuffix('.')
+
+    try:
+        with open('.setup-cache.json', 'w', encoding='utf-8') as fh:
+            json.dump(
+                {
+                    'key': cachekey,
+                    'version': version,
+                    'description': description,
+                },
+                fh,
+            )
+    except OSError:
+        pass
+
+version = version.replace('.x.x', '.dev0')
+version += ('.' + buildnumber) if buildnumber else ''
+
+if 'sdist' in sys.argv:
+    # update README, LICENSE, and CHANGES files older than source code
+
+    if not isnewer('README.rst', 'liffile/liffile.py'):
+        readme = between(code, '\n\n"""', '"""\n\nfrom __future__')
+        readme = '\n'.join(
+            [description, '=' * len(description)] + readme.splitlines()[1:]
+        )
+        write_file('README.rst', fix_docstring_examples(readme))
+
+    if not isnewer('LICENSE', 'liffile/liffile.py'):
+        license = between(code, '# Copyright', '\n\n"""')
+        license = '# Copyright' + license + '\n'
+        license = license.replace('# ', '').replace('#', '')
+        write_file('LICENSE', 'BSD-3-Clause license\n\n' + license)
+
+    if not isnewer('CHANGES.rst', 'liffile/liffile.py'):
+        revisions = 'Revisions' + between(code, '\n\nRevisions', '- …')
+        revisions = revisions.strip()
+
+        with open('CHANGES.rst', encoding='utf-8') as fh:
+            old = fh.read()
+
+        # keep old revisions following the last revision in the docstring
+        last = revisions[revisions.rfind('\n') + 1 :]
+        index = old.rfind(last)
+        if index >= 0:
+            old = old[index + len(last) :]
+        write_file('CHANGES.rst', revisions + old)
+
+if os.path.exists('README.rst'):
+    with open('README.rst', encoding='utf-8') as fh:
+        readme = fh.read()
+else:
+    readme = description
+
+setup(
+    name='liffile',
+    version=version,
+    license='BSD-3-Clause',
+    description=description,
+    long_description=readme,
+    long_description_content_type='text/x-rst',
+    author='Christoph Gohlke',
+    author_email='cgohlke@cgohlke.com',
+    url='https://www.cgohlke.com',
+    project_urls={
+        'Bug Tracker': 'https://github.com/cgohlke/liffile/issues',
+        'Source Code': 'https://github.com/cgohlke/liffile',
+        # 'Documentation': 'https://',
+    },
+    packages=['liffile'],
+    package_data={'liffile': ['py.typed']},
+    entry_points={'console_scripts': ['liffile = liffile.__main__:main']},
+    python_requires='>=3.11',
+    install_requires=['numpy'],
+    extras_require={
+        'all': ['xarray', 'tifffile', 'imagecodecs', 'matplotlib']
+    },
+    # ext_modules=ext_modules(),
+    zip_safe=False,
+    platforms=['any'],
+    classifiers=[
+        'Development Status :: 3 - Alpha',
+        'Intended Audience :: Science/Research',
+        'Intended Audience :: Developers',
+        'Operating System :: OS Independent',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
+        'Programming Language :: Python :: 3.13',
+        'Programming Language :: Python :: 3.14',
+    ],
+)
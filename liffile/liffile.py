@@ -74,6 +74,10 @@ This revision was tested with the following requirements and dependencies
 Revisions
 ---------
 
+2025.x.x
+
+- Add LifFile.read_all method to read images in thread pool.
+
 2025.9.28
 
 - Derive LifFileError from ValueError.
@@ -222,6 +226,7 @@ __all__ = [
     'FILE_EXTENSIONS',
 ]
 
+import codecs
 import enum
 import logging
 import math
@@ -229,6 +234,7 @@ import os
 import re
 import struct
 import sys
+import threading
 import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -366,7 +372,8 @@ class LifFileType(enum.Enum):
 class LifFile:
     """Leica image file (LIF, LOF, XLIF, XLEF, XLCF, or LIFEXT).
 
-    ``LifFile`` instances are not thread-safe. All attributes are read-only.
+    ``LifFile`` instances are not thread-safe, except for reading image data
+    and memory blocks. All attributes are read-only.
 
     ``LifFile`` instances must be closed with :py:meth:`LifFile.close`,
     which is automatically called when using the 'with' context manager.
@@ -408,6 +415,7 @@ class LifFile:
     """Object memory blocks."""
 
     _fh: IO[bytes]
+    _lock: threading.RLock  # synchronize access to file handle
     _path: str  # absolute path of file
     _close: bool  # file needs to be closed
     _squeeze: bool  # remove dimensions of length one from images
@@ -441,6 +449,7 @@ class LifFile:
         else:
             raise ValueError(f'cannot open file of type {type(file)}')
 
+        self._lock = threading.RLock()
         self._parent = _parent
         self._squeeze = bool(squeeze)
         self.type = LifFileType.LIF
@@ -486,7 +495,10 @@ class LifFile:
         elif id0 == 0x70 and id1 == 0x2A:  # or size != 2 * strlen + 5
             self.type = LifFileType.LIF
             self._xml_header = (fh.tell(), strlen * 2)
-            xml_header = fh.read(strlen * 2).decode('utf-16-le')
+            # read only start of XML to detect LOF and LIFEXT files;
+            # remaining LIF XML is parsed incrementally from file below
+            head = fh.read(min(strlen * 2, 64))
+            xml_header = head.decode('utf-16-le', errors='ignore')
 
         else:
             raise LifFileError(
@@ -543,7 +555,14 @@ class LifFile:
         elif xml_header.startswith('<LMSDataContainerEnhancedHeader'):
             self.type = LifFileType.LIFEXT
 
-        self.xml_element = ElementTree.fromstring(xml_header)
+        if self.type == LifFileType.LOF or self._xml_header[1] < 0:
+            self.xml_element = ElementTree.fromstring(xml_header)
+        else:
+            # LIF or LIFEXT
+            start, size = self._xml_header
+            self.xml_element = parse_xml(
+                fh, start + size - fh.tell(), head, encoding='utf-16-le'
+            )
         del xml_header
 
         element = self.xml_element.find('./Element')
@@ -677,12 +696,61 @@ class LifFile:
                 fh.seek(self._xml_header[0])
                 xml = fh.read(self._xml_header[1])
         else:
-            self._fh.seek(self._xml_header[0])
-            xml = self._fh.read(self._xml_header[1])
+            with self._lock:
+                self._fh.seek(self._xml_header[0])
+                xml = self._fh.read(self._xml_header[1])
         if self._xml_header[1] < 0:
             return xml.decode(XML_CODEC[xml[:4]])
         return xml.decode('utf-16-le')
 
+    def read_all(
+        self, /, *, maxworkers: int | None = None, **kwargs: Any
+    ) -> dict[str, DataArray]:
+        """Return image data of all images in file as xarrays.
+
+        FLIM/TCSPC histogram images are skipped.
+        Memory blocks in files on disk are read concurrently with positional
+        reads where supported. Reads from binary streams are serialized.
+
+        Parameters:
+            maxworkers:
+                Maximum number of threads to read images concurrently.
+                By default, up to ``min(32, os.cpu_count() + 4)`` threads
+                are used.
+            **kwargs:
+                Optional arguments to :py:meth:`LifImage.asxarray`.
+                Images cannot share an `out` array or file. Only ``None``,
+                ``'memmap'``, or ``'memmap:tempdir'`` are allowed.
+
+        Returns:
+            :
+                Mapping of image paths to image data.
+
+        Raises:
+            ValueError: `out` is an array or file shared by all images.
+
+        """
+        out = kwargs.get('out')
+        if out is not None and not (
+            isinstance(out, str) and out[:6] == 'memmap'
+        ):
+            raise ValueError('cannot read all images into same output')
+
+        images = [image for image in self.images if not image.is_flim]
+        if maxworkers == 1 or len(images) < 2:
+            return {image.path: image.asxarray(**kwargs) for image in images}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(maxworkers) as executor:
+            futures = [
+                executor.submit(image.asxarray, **kwargs) for image in images
+            ]
+            return {
+                image.path: future.result()
+                for image, future in zip(images, futures)
+            }
+
     def close(self) -> None:
         """Close file handle and free resources."""
         if self._close:
@@ -822,12 +890,12 @@ class LifImageABC(ABC):
     def sizes(self) -> dict[str, int]:
         """Map dimension names to lengths."""
 
-    @property
+    @cached_property
     def shape(self) -> tuple[int, ...]:
         """Shape of image."""
         return tuple(self.sizes.values())
 
-    @property
+    @cached_property
     def dims(self) -> tuple[str, ...]:
         """Character codes of dimensions in image."""
         return tuple(self.sizes.keys())
@@ -840,12 +908,9 @@ class LifImageABC(ABC):
     @property
     def nbytes(self) -> int:
         """Number of bytes consumed by image."""
-        size = 1
-        for i in self.sizes.values():
-            size *= int(i)
-        return size * self.dtype.itemsize
+        return self.size * self.dtype.itemsize
 
-    @property
+    @cached_property
     def size(self) -> int:
         """Number of elements in image."""
         size = 1
@@ -997,6 +1062,15 @@ class LifImageABC(ABC):
         return r
 
     def __str__(self) -> str:
+        return self._str
+
+    @cached_property
+    def _str(self) -> str:
+        """String representation of image properties.
+
+        Images do not change after parsing the XML metadata.
+
+        """
         return indent(
             repr(self),
             *(
@@ -1027,6 +1101,11 @@ class LifImage(LifImageABC):
             DeprecationWarning,
             stacklevel=2,
         )
+        return self._xml_element_smd
+
+    @cached_property
+    def _xml_element_smd(self) -> ElementTree.Element | None:
+        """SingleMoleculeDetection XML element found in parent file."""
         uuid = self.uuid
         return self.parent.xml_element.find(
             f'.//Element[@UniqueID="{uuid}"]../../Data/SingleMoleculeDetection'
@@ -1219,23 +1298,23 @@ class LifImage(LifImageABC):
         )
         return attrs
 
-    @property
+    @cached_property
     def timestamps(self) -> NDArray[numpy.datetime64]:
         timestamp = self.xml_element.find('./Data/Image/TimeStampList')
         if timestamp is None:
             return numpy.asarray([], dtype=numpy.datetime64)
         timestamps: Any
-        if timestamp.find('./TimeStamp') is not None:
+        elements = timestamp.findall('./TimeStamp')
+        if elements:
             # LAS < 3.1
-            text = ElementTree.tostring(timestamp).decode()
-            high_integers = ' '.join(re.findall(r'HighInteger="(\d+)"', text))
-            low_integers = ' '.join(re.findall(r'LowInteger="(\d+)"', text))
-            timestamps = numpy.fromstring(
-                high_integers, dtype=numpy.uint64, sep=' '
-            )
-            timestamps <<= 32
-            timestamps += numpy.fromstring(
-                low_integers, dtype=numpy.uint32, sep=' '
+            timestamps = numpy.fromiter(
+                (
+                    (int(element.attrib['HighInteger']) << 32)
+                    + int(element.attrib['LowInteger'])
+                    for element in elements
+                ),
+                dtype=numpy.uint64,
+                count=len(elements),
             )
         elif timestamp.text is not None:
             # LAS >= 3.1
@@ -1480,13 +1559,13 @@ class LifImageSeries(Sequence[LifImageABC]):
 
         if parent.type not in {LifFileType.XLEF, LifFileType.XLCF}:
             keepbase = parent.type == LifFileType.LIFEXT
-            for path, element in self._image_iter(parent.xml_element):
+            for path, element, is_flim in self._image_iter(parent.xml_element):
                 if not keepbase:
                     path = path.split('/', 1)[-1]
-                if element.find('./Data/SingleMoleculeDetection') is None:
-                    image = LifImage(parent, element, path)
-                else:
+                if is_flim:
                     image = LifFlimImage(parent, element, path)
+                else:
+                    image = LifImage(parent, element, path)
                 self._images[path] = image
 
         for child in parent.children:
@@ -1503,8 +1582,8 @@ class LifImageSeries(Sequence[LifImageABC]):
         xml_element: ElementTree.Element,
         base_path: str = '',
         /,
-    ) -> Iterator[tuple[str, ElementTree.Element]]:
-        """Return iterator of image paths and XML elements."""
+    ) -> Iterator[tuple[str, ElementTree.Element, bool]]:
+        """Return iterator of image paths, XML elements, and FLIM flags."""
         elements = xml_element.findall('./Children/Element')
         if len(elements) < 1:
             elements = xml_element.findall('./Element')
@@ -1521,22 +1600,31 @@ class LifImageSeries(Sequence[LifImageABC]):
                 path = name
             else:
                 path = f'{base_path}/{name}'
-            image = element.find('./Data/Image')
-            if image is not None:
-                yield path, element
-            else:
-                # FLIM/TCSPC
-                image = element.find(
-                    './Data/SingleMoleculeDetection[@IsImage="true"]'
-                )
-                if image is not None:
-                    yield path, element
+            is_image = is_flim = False
+            for data in element:
+                if data.tag != 'Data':
+                    continue
+                for child in data:
+                    if child.tag == 'Image':
+                        is_image = True
+                    elif child.tag == 'SingleMoleculeDetection':
+                        # FLIM/TCSPC
+                        is_flim = True
+                        if child.get('IsImage') == 'true':
+                            is_image = True
+            if is_image:
+                yield path, element, is_flim
             if element.find('./Children/Element/Data') is not None:
                 # sub images
                 yield from LifImageSeries._image_iter(element, path)
 
     def find(
-        self, key: str, /, *, flags: int = re.IGNORECASE, default: Any = None
+        self,
+        key: str | re.Pattern[str],
+        /,
+        *,
+        flags: int = re.IGNORECASE,
+        default: Any = None,
     ) -> LifImageABC | None:
         """Return first image with matching path pattern, if any.
 
@@ -1544,19 +1632,22 @@ class LifImageSeries(Sequence[LifImageABC]):
             key:
                 Regular expression pattern to match LifImage.path.
             flags:
-                Regular expression flags.
+                Regular expression flags. Ignored if key is compiled.
             default:
                 Value to return if no image with matching path found.
 
         """
-        pattern = re.compile(key, flags=flags)
+        if isinstance(key, re.Pattern):
+            pattern = key
+        else:
+            pattern = compile_pattern(key, flags)
         for image in self._images.values():
             if pattern.search(image.path) is not None:
                 return image
         return default  # type: ignore[no-any-return]
 
     def findall(
-        self, key: str, /, *, flags: int = re.IGNORECASE
+        self, key: str | re.Pattern[str], /, *, flags: int = re.IGNORECASE
     ) -> tuple[LifImageABC, ...]:
         """Return all images with matching path pattern.
 
@@ -1564,10 +1655,13 @@ class LifImageSeries(Sequence[LifImageABC]):
             key:
                 Regular expression pattern to match LifImage.path.
             flags:
-                Regular expression flags.
+                Regular expression flags. Ignored if key is compiled.
 
         """
-        pattern = re.compile(key, flags=flags)
+        if isinstance(key, re.Pattern):
+            pattern = key
+        else:
+            pattern = compile_pattern(key, flags)
         images = []
         for image in self._images.values():
             if pattern.search(image.path) is not None:
@@ -1576,7 +1670,7 @@ class LifImageSeries(Sequence[LifImageABC]):
 
     def __getitem__(  # type: ignore[override]
         self,
-        key: int | str,
+        key: int | str | re.Pattern[str],
         /,
     ) -> LifImageABC:
         """Return image at index or first image with matching path.
@@ -1592,9 +1686,12 @@ class LifImageSeries(Sequence[LifImageABC]):
             except IndexError:
                 raise IndexError(f'image index={key} out of range')
             return self._images[key]
-        if key in self._images:
+        if isinstance(key, re.Pattern):
+            pattern = key
+        elif key in self._images:
             return self._images[key]
-        pattern = re.compile(key, flags=re.IGNORECASE)
+        else:
+            pattern = compile_pattern(key, re.IGNORECASE)
         for image in self._images.values():
             if pattern.search(image.path) is not None:
                 return image
@@ -1732,19 +1829,41 @@ class LifMemoryBlock:
                 data = lof.images[0].memory_block.read()
             return data
         if len(self.frames) > 0:
-            dirname = self.parent.dirname
             buffer = bytearray(self.size)
-            for frame in self.frames:
-                im = frame.imread(dirname)
-                buffer[frame.offset : frame.offset + frame.size] = im.tobytes()
+            self.readinto(numpy.frombuffer(buffer, numpy.uint8))
             return bytes(buffer)
 
-        self.parent.filehandle.seek(self.offset)
-        buffer = self.parent.filehandle.read(self.size)
+        fd = self._fileno()
+        if fd < 0:
+            with self.parent._lock:
+                self.parent.filehandle.seek(self.offset)
+                buffer = self.parent.filehandle.read(self.size)
+        else:
+            # positional reads do not move file position and need no lock
+            chunks = []
+            offset = self.offset
+            size = self.size
+            while size > 0:
+                chunk = os.pread(fd, size, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+                size -= len(chunk)
+            buffer = b''.join(chunks)
         if len(buffer) != self.size:
             raise OSError(f'read {len(buffer)} bytes, expected {self.size}')
         return buffer
 
+    def _fileno(self) -> int:
+        """Return file descriptor for positional reads or -1."""
+        if not hasattr(os, 'preadv'):
+            return -1
+        try:
+            return self.parent.filehandle.fileno()
+        except (AttributeError, OSError):
+            return -1  # not a file on disk, e.g. BytesIO or mmap
+
     def readinto(self, buffer: NDArray[Any], /) -> None:
         """Read memory block from file into contiguous ndarray."""
         if not buffer.flags.c_contiguous:
@@ -1760,14 +1879,34 @@ class LifMemoryBlock:
                 buffer[frame.offset : frame.offset + frame.size] = im
             return
 
-        fh = self.parent.filehandle
-        fh.seek(self.offset)
-        try:
-            nbytes = fh.readinto(buffer)  # type: ignore[attr-defined]
-        except (AttributeError, OSError):
-            data = fh.read(self.size)
-            nbytes = len(data)
-            buffer[:] = numpy.frombuffer(data, numpy.uint8)
+        fd = self._fileno()
+        if fd < 0:
+            fh = self.parent.filehandle
+            with self.parent._lock:
+                fh.seek(self.offset)
+                try:
+                    nbytes = fh.readinto(buffer)  # type: ignore[attr-defined]
+                except (AttributeError, OSError):
+                    data = fh.read(self.size)
+                    nbytes = len(data)
+                    buffer[:] = numpy.frombuffer(data, numpy.uint8)
+        else:
+            if hasattr(os, 'posix_fadvise'):
+                # increase kernel read-ahead for large sequential read
+                try:
+                    os.posix_fadvise(
+                        fd, self.offset, self.size, os.POSIX_FADV_SEQUENTIAL
+                    )
+                except OSError:
+                    pass
+            # positional reads do not move file position and need no lock
+            view = buffer.data
+            nbytes = 0
+            while nbytes < self.size:
+                size = os.preadv(fd, [view[nbytes:]], self.offset + nbytes)
+                if size == 0:
+                    break
+                nbytes += size
 
         if nbytes != self.size:
             raise OSError(f'read {nbytes} bytes, expected {self.size}')
@@ -1813,14 +1952,32 @@ class LifMemoryBlock:
         fh = self.parent.filehandle
 
         if isinstance(out, str) and out == 'memmap' and self.offset > 0:
-            return numpy.memmap(  # type: ignore[no-any-return]
-                fh,  # type: ignore[call-overload]
-                dtype=dtype,
-                mode=mode,
-                offset=self.offset,
-                shape=shape,
-                order='C',
+            try:
+                fh.fileno()
+            except (AttributeError, OSError):
+                pass  # not a file on disk, e.g. BytesIO
+            else:
+                with self.parent._lock:
+                    return numpy.memmap(  # type: ignore[no-any-return]
+                        fh,  # type: ignore[call-overload]
+                        dtype=dtype,
+                        mode=mode,
+                        offset=self.offset,
+                        shape=shape,
+                        order='C',
+                    )
+
+        if (
+            isinstance(out, str)
+            and out == 'memmap'
+            and len(self.frames) == 1
+            and self.frames[0].file.endswith('.lof')
+        ):
+            # directly memory-map image data in referenced LOF file
+            data = self.frames[0].imread(
+                self.parent.dirname, mode=mode, out='memmap'
             )
+            return data.view(dtype).reshape(shape)
 
         if (
             out is None
@@ -2172,6 +2329,55 @@ def case_sensitive_path(path: str, /) -> str:
         raise FileNotFoundError(f'{str(path)!r} not accessible') from exc
 
 
+def parse_xml(
+    fh: IO[bytes],
+    size: int,
+    /,
+    head: bytes = b'',
+    *,
+    encoding: str = 'utf-8',
+    chunksize: int = 2**22,
+) -> ElementTree.Element:
+    """Return root element of XML read from file in chunks.
+
+    Unlike parsing the whole decoded XML string, the encoded and decoded
+    XML are never held in memory at once.
+
+    Parameters:
+        fh: Open file positioned at end of `head`.
+        size: Number of bytes of XML remaining in file.
+        head: Start of encoded XML already read from file.
+        encoding: Encoding of XML.
+        chunksize: Number of bytes to read and parse at once.
+
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parser = ElementTree.XMLParser()
+    parser.feed(decoder.decode(head))
+    while size > 0:
+        data = fh.read(min(size, chunksize))
+        if not data:
+            break
+        size -= len(data)
+        parser.feed(decoder.decode(data))
+    parser.feed(decoder.decode(b'', final=True))
+    return parser.close()
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0, /) -> re.Pattern[str]:
+    """Return compiled regular expression pattern.
+
+    Results are cached for repeated image lookups by path pattern.
+
+    Parameters:
+        pattern: Regular expression pattern.
+        flags: Regular expression flags.
+
+    """
+    return re.compile(pattern, flags)
+
+
 def xml2dict(
     xml_element: ElementTree.Element,
     /,
@@ -2196,11 +2402,22 @@ def xml2dict(
     """
     at, tx = prefix if prefix else ('', '')
     exclude = set() if exclude is None else exclude
+    # attribute values repeat often in Leica XML; converted values are
+    # immutable and can be shared
+    converted: dict[str, Any] = {}
 
     def astype(value: Any, /) -> Any:
         # return string value as int, float, bool, tuple, or unchanged
         if not isinstance(value, str):
             return value
+        try:
+            return converted[value]
+        except KeyError:
+            pass
+        result = converted[value] = convert(value)
+        return result
+
+    def convert(value: str, /) -> Any:
         if sep and sep in value:
             # sequence of numbers?
             values = []
@@ -2210,7 +2427,8 @@ def xml2dict(
                     return value
                 values.append(v)
             return tuple(values)
-        for t in (int, float, asbool):
+        # int never parses decimal numbers such as stage positions
+        for t in (float, asbool) if '.' in value else (int, float, asbool):
             try:
                 return t(value)
             except (TypeError, ValueError):
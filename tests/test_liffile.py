@@ -37,6 +37,8 @@ import datetime
 import glob
 import io
 import itertools
+import math
+import mmap
 import os
 import pathlib
 import re
@@ -47,9 +49,7 @@ from xml.etree import ElementTree
 
 import numpy
 import pytest
-import xarray
 from numpy.testing import assert_allclose, assert_array_equal
-from xarray import DataArray
 
 import liffile
 from liffile import (
@@ -66,785 +66,73 @@ from liffile import (
     imread,
     xml2dict,
 )
-from liffile.liffile import case_sensitive_path
+from liffile.liffile import case_sensitive_path, compile_pattern
 
 HERE = pathlib.Path(os.path.dirname(__file__))
 DATA = HERE / 'data'
+SCANMODES_LIF = str(DATA / 'ScanModesExamples.lif')
+SCANMODES_DATETIME = datetime.datetime(
+    2013, 12, 2, 8, 27, 44, tzinfo=datetime.UTC
+)
+
+LAMBDA_RE = re.compile('XZEXcLambda/Lambda.*', re.IGNORECASE)
+
+
+def parse_scanmodes():
+    """Return path, sizes, and dtype of images in ScanModesExamples.lif.
+
+    Sizes are in order of dimensions in file.
+
+    """
+    scanmodes = []
+    with open(HERE / 'scanmodes.txt', encoding='utf-8') as fh:
+        lines = fh.read().splitlines()
+    for line in lines:
+        if not line or line.startswith('#'):
+            continue
+        path, sizes, dtype = line.split('|')
+        sizes = {
+            dim: int(size)
+            for dim, size in (token.split('=') for token in sizes.split(','))
+        }
+        scanmodes.append((path, sizes, dtype))
+    return scanmodes
+
+
+SCANMODES = parse_scanmodes()
+SCANMODES_PATHS = [path for path, _, _ in SCANMODES]
+
+IMAGE_ATTRS = (
+    'dtype',
+    'itemsize',
+    'shape',
+    'dims',
+    'sizes',
+    'size',
+    'nbytes',
+    'ndim',
+)
 
-SCANMODES = [
-    ('XT-Slices', {'N': 5, 'C': 2, 'T': 10, 'X': 128}, 'uint8'),
-    ('XYZ', {'Z': 5, 'C': 2, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XZY', {'Y': 5, 'C': 2, 'Z': 128, 'X': 128}, 'uint8'),
-    ('XYT', {'T': 7, 'C': 2, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XZT', {'T': 7, 'C': 2, 'Z': 128, 'X': 128}, 'uint8'),
-    ('XYZT', {'T': 7, 'Z': 5, 'C': 2, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XZYT', {'T': 7, 'Y': 5, 'C': 2, 'Z': 128, 'X': 128}, 'uint8'),
-    ('XYLambda', {'λ': 9, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XZLambda', {'λ': 9, 'Z': 128, 'X': 128}, 'uint8'),
-    ('XYLamdaZ', {'Z': 5, 'λ': 9, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XYLambdaT', {'T': 7, 'λ': 9, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XZLambdaT', {'T': 7, 'λ': 9, 'Z': 128, 'X': 128}, 'uint8'),
-    ('XYZLambdaT', {'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XYZLambda', {'T': 1, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XYTZ', {'Z': 5, 'T': 7, 'Y': 128, 'X': 128}, 'uint8'),
-    ('XY_12Bit', {'Y': 128, 'X': 128}, 'uint16'),
-    ('Job XYExc', {'Λ': 10, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcT', {'T': 7, 'Λ': 10, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYZExc', {'Λ': 10, 'Z': 5, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXc', {'Λ': 10, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_496nm', {'Λ': 1, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_530nm', {'Λ': 2, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_564nm', {'Λ': 4, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_598nm', {'Λ': 5, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_632nm', {'Λ': 7, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_666nm', {'Λ': 8, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_700nm', {'Λ': 10, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_734nm', {'Λ': 10, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XZEXcLambda/Lambda_769nm', {'Λ': 10, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_496nm', {'Λ': 1, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_530nm', {'Λ': 2, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_564nm', {'Λ': 4, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_598nm', {'Λ': 5, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_632nm', {'Λ': 7, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_666nm', {'Λ': 8, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_700nm', {'Λ': 10, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_734nm', {'Λ': 10, 'Y': 128, 'X': 128}, 'uint8'),
-    ('Job XYExcLambda /Lambda_769nm', {'Λ': 10, 'Y': 128, 'X': 128}, 'uint8'),
-    (
-        'Mark_and_Find_XYExc/Position1001',
-        {'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYExc/Position2002',
-        {'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYExc/Position3003',
-        {'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYExcT/Position1001',
-        {'T': 7, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYExcT/Position2002',
-        {'T': 7, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYExcT/Position3003',
-        {'T': 7, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZExc/Position1001',
-        {'Λ': 10, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZExc/Position2002',
-        {'Λ': 10, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZExc/Position3003',
-        {'Λ': 10, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZExc/Position1001',
-        {'Λ': 10, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZExc/Position2002',
-        {'Λ': 10, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZExc/Position3003',
-        {'Λ': 10, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZYT/Position1001',
-        {'T': 7, 'Y': 5, 'C': 2, 'Z': 256, 'X': 256},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZYT/Position2002',
-        {'T': 7, 'Y': 5, 'C': 2, 'Z': 256, 'X': 256},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZYT/Position3003',
-        {'T': 7, 'Y': 5, 'C': 2, 'Z': 256, 'X': 256},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZY/Position1001',
-        {'Y': 5, 'C': 2, 'Z': 32, 'X': 512},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZY/Position2002',
-        {'Y': 5, 'C': 2, 'Z': 32, 'X': 512},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZY/Position3003',
-        {'Y': 5, 'C': 2, 'Z': 32, 'X': 512},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZ/Position1001',
-        {'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZ/Position2002',
-        {'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZ/Position3003',
-        {'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZ/Position4004',
-        {'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZ/Position5005',
-        {'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZ/Position6006',
-        {'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYT/Position1001',
-        {'T': 7, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYT/Position2002',
-        {'T': 7, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYT/Position3003',
-        {'T': 7, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYT/Position4004',
-        {'T': 7, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYT/Position5005',
-        {'T': 7, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYT/Position6006',
-        {'T': 7, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZT/Position1001',
-        {'T': 7, 'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZT/Position2002',
-        {'T': 7, 'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZT/Position3003',
-        {'T': 7, 'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZT/Position4004',
-        {'T': 7, 'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZT/Position5005',
-        {'T': 7, 'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZT/Position6006',
-        {'T': 7, 'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambda/Position1001',
-        {'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambda/Position2002',
-        {'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambda/Position3003',
-        {'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambda/Position4004',
-        {'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambda/Position5005',
-        {'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambda/Position6006',
-        {'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaZ/Position1001',
-        {'Z': 5, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaZ/Position2002',
-        {'Z': 5, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaZ/Position3003',
-        {'Z': 5, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaZ/Position4004',
-        {'Z': 5, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaZ/Position5005',
-        {'Z': 5, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaZ/Position6006',
-        {'Z': 5, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaT/Position1001',
-        {'T': 7, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaT/Position2002',
-        {'T': 7, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaT/Position3003',
-        {'T': 7, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaT/Position4004',
-        {'T': 7, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaT/Position5005',
-        {'T': 7, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYLambdaT/Position6006',
-        {'T': 7, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZLambdaT/Position1001',
-        {'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZLambdaT/Position2002',
-        {'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZLambdaT/Position3003',
-        {'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZLambdaT/Position4004',
-        {'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZLambdaT/Position5005',
-        {'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XYZLambdaT/Position6006',
-        {'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambda/Position2002',
-        {'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambda/Position3003',
-        {'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambda/Position4004',
-        {'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambda/Position5005',
-        {'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambda/Position6006',
-        {'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambda/Position7007',
-        {'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambdaT/Position2002',
-        {'T': 7, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambdaT/Position3003',
-        {'T': 7, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambdaT/Position4004',
-        {'T': 7, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambdaT/Position5005',
-        {'T': 7, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambdaT/Position6006',
-        {'T': 7, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'Mark_and_Find_XZLambdaT/Position7007',
-        {'T': 7, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    ('Mark_and_Find_XT/Position2002', {'N': 4, 'T': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XT/Position3003', {'N': 4, 'T': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XT/Position4004', {'N': 4, 'T': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XT/Position5005', {'N': 4, 'T': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XT/Position6006', {'N': 4, 'T': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XT/Position7007', {'N': 4, 'T': 128, 'X': 128}, 'uint8'),
-    (
-        'SequenceLambda/Job_XYL095',
-        {'L': 3, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceLambda/Job_XZL096',
-        {'L': 3, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceLambda/Job_XYZL097',
-        {'T': 1, 'L': 3, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceLambda/Job_XYLZ098',
-        {'L': 3, 'Z': 5, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceLambda/Job_XYLT099',
-        {'L': 3, 'T': 7, 'λ': 9, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceLambda/Job_XZLT100',
-        {'L': 3, 'T': 7, 'λ': 9, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceLambda/Job_XYZLT101',
-        {'L': 3, 'T': 7, 'λ': 9, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XT001',
-        {'N': 1, 'L': 3, 'T': 512, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XYZ1_002',
-        {'Z': 1, 'L': 3, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XYT003',
-        {'L': 3, 'T': 7, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XYTZ004',
-        {'L': 3, 'Z': 5, 'T': 7, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XYZ005',
-        {'L': 3, 'Z': 5, 'C': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XYZT006',
-        {'L': 3, 'T': 7, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XZT007',
-        {'L': 3, 'T': 7, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XZY008',
-        {'L': 3, 'Y': 5, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceOrtZeit/Job_XZYT009',
-        {'L': 3, 'T': 7, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/Job XYEXc 01_020',
-        {'L': 3, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/Job XYEXcT 01_021',
-        {'L': 3, 'T': 7, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/Job XYZEXc 01_022',
-        {'L': 3, 'Λ': 10, 'Z': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/Job XZEXc 01_023',
-        {'L': 3, 'Λ': 10, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_496nm',
-        {'Λ': 1, 'L': 3, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_530nm',
-        {'L': 3, 'Λ': 2, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_564nm',
-        {'L': 3, 'Λ': 4, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_598nm',
-        {'L': 3, 'Λ': 5, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_632nm',
-        {'L': 3, 'Λ': 7, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_666nm',
-        {'L': 3, 'Λ': 8, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_700nm',
-        {'L': 3, 'Λ': 10, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_734nm',
-        {'L': 3, 'Λ': 10, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_004/Lambda_769nm',
-        {'L': 3, 'Λ': 10, 'Z': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_496nm',
-        {'Λ': 1, 'L': 3, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_530nm',
-        {'L': 3, 'Λ': 2, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_564nm',
-        {'L': 3, 'Λ': 4, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_598nm',
-        {'L': 3, 'Λ': 5, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_632nm',
-        {'L': 3, 'Λ': 7, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_666nm',
-        {'L': 3, 'Λ': 8, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_700nm',
-        {'L': 3, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_734nm',
-        {'L': 3, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    (
-        'SequenceExc/LambdaLambda_005/Lambda_769nm',
-        {'L': 3, 'Λ': 10, 'Y': 128, 'X': 128},
-        'uint8',
-    ),
-    ('Mark_and_Find_XZT/Position2002', {'T': 7, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XZT/Position3003', {'T': 7, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XZT/Position4004', {'T': 7, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XZT/Position5005', {'T': 7, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XZT/Position6006', {'T': 7, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Mark_and_Find_XZT/Position7007', {'T': 7, 'Z': 128, 'X': 128}, 'uint8'),
-    ('Widefield.lif/XY_8Bit', {'Y': 130, 'X': 172}, 'uint8'),
-    ('Widefield.lif/XYZ_8Bit', {'Z': 5, 'Y': 130, 'X': 172}, 'uint8'),
-    ('Widefield.lif/XYT_8Bit', {'T': 7, 'Y': 130, 'X': 172}, 'uint8'),
-    ('Widefield.lif/XYZT_8Bit', {'T': 7, 'Z': 5, 'Y': 130, 'X': 172}, 'uint8'),
-    ('Widefield.lif/XY_12Bit', {'Y': 130, 'X': 172}, 'uint16'),
-    ('Widefield.lif/XYZ_12Bit', {'Z': 5, 'Y': 130, 'X': 172}, 'uint16'),
-    ('Widefield.lif/XYT_12Bit', {'T': 7, 'Y': 130, 'X': 172}, 'uint16'),
-    (
-        'Widefield.lif/XYZT_12Bit',
-        {'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XY_12Bit/Position1001',
-        {'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XY_12Bit/Position2002',
-        {'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XY_12Bit/Position3003',
-        {'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XY_8Bit/Position1001',
-        {'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XY_8Bit/Position2002',
-        {'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XY_8Bit/Position3003',
-        {'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZ_8Bit/Position1001',
-        {'Z': 5, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZ_8Bit/Position2002',
-        {'Z': 5, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZ_8Bit/Position3003',
-        {'Z': 5, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZ_12Bit/Position1001',
-        {'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZ_12Bit/Position2002',
-        {'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZ_12Bit/Position3003',
-        {'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZT_12Bit/Position1001',
-        {'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZT_12Bit/Position2002',
-        {'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZT_12Bit/Position3003',
-        {'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZT_8Bit/Position1001',
-        {'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZT_8Bit/Position2002',
-        {'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYZT_8Bit/Position3003',
-        {'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYT_8Bit/Position1001',
-        {'T': 7, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYT_8Bit/Position2002',
-        {'T': 7, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYT_8Bit/Position3003',
-        {'T': 7, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYT_12Bit/Position1001',
-        {'T': 7, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYT_12Bit/Position2002',
-        {'T': 7, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Mark_and_Find_XYT_12Bit/Position3003',
-        {'T': 7, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Sequence_8Bit_2Loops/XY042',
-        {'L': 2, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Sequence_8Bit_2Loops/XYZ043',
-        {'L': 2, 'Z': 9, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Sequence_8Bit_2Loops/XYT044',
-        {'L': 2, 'T': 7, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Sequence_8Bit_2Loops/XYZT045',
-        {'L': 2, 'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint8',
-    ),
-    (
-        'Widefield.lif/Sequence_12Bit_3Loops/XY054',
-        {'L': 3, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Sequence_12Bit_3Loops/XYZ055',
-        {'L': 3, 'Z': 9, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Sequence_12Bit_3Loops/XYT056',
-        {'L': 3, 'T': 7, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-    (
-        'Widefield.lif/Sequence_12Bit_3Loops/XYZT057',
-        {'L': 3, 'T': 7, 'Z': 5, 'Y': 130, 'X': 172},
-        'uint16',
-    ),
-]
+
+def image_attrs(image):
+    """Return IMAGE_ATTRS of image as dict."""
+    return {name: getattr(image, name) for name in IMAGE_ATTRS}
+
+
+def expected_attrs(sizes, dtype):
+    """Return IMAGE_ATTRS expected for image of sizes and dtype as dict."""
+    dtype = numpy.dtype(dtype)
+    size = math.prod(sizes.values())
+    return {
+        'dtype': dtype,
+        'itemsize': dtype.itemsize,
+        'shape': tuple(sizes.values()),
+        'dims': tuple(sizes.keys()),
+        'sizes': sizes,
+        'size': size,
+        'nbytes': size * dtype.itemsize,
+        'ndim': len(sizes),
+    }
 
 
 @pytest.mark.skipif(__doc__ is None, reason='__doc__ is None')
@@ -868,49 +156,65 @@ def test_not_lif():
 @pytest.mark.parametrize('asxarray', [False, True])
 def test_imread(asxarray):
     """Test imread function."""
-    filename = DATA / 'ScanModesExamples.lif'
+    if asxarray:
+        xarray = pytest.importorskip('xarray')
+    filename = SCANMODES_LIF
 
     data = imread(filename, image=5, out=None, asxarray=asxarray)
     if asxarray:
-        assert isinstance(data, DataArray)
+        assert isinstance(data, xarray.DataArray)
         assert data.sizes == {'T': 7, 'Z': 5, 'C': 2, 'Y': 128, 'X': 128}
         data = data.data
     else:
         assert isinstance(data, numpy.ndarray)
     assert data.shape == (7, 5, 2, 128, 128)
-    assert data.sum(dtype=numpy.uint32) == 27141756
+    assert data.flags.c_contiguous
+    assert numpy.add.reduce(data.reshape(-1), dtype=numpy.uint32) == 27141756
 
 
-@pytest.mark.parametrize('filetype', [str, io.BytesIO])
-def test_lif(filetype):
+@pytest.fixture(scope='session')
+def lif_bytes():
+    """Return content of ScanModesExamples.lif read once per session."""
+    return pathlib.Path(SCANMODES_LIF).read_bytes()
+
+
+@pytest.mark.parametrize('filetype', [str, io.BufferedReader, io.BytesIO])
+def test_lif(filetype, request):
     """Test LIF file."""
-    filename = DATA / 'ScanModesExamples.lif'
-    file = filename if filetype is str else open(filename, 'rb')
+    xarray = pytest.importorskip('xarray')
+    filename = SCANMODES_LIF
+    if filetype is str:
+        file = filename
+    elif filetype is io.BufferedReader:
+        file = open(filename, 'rb')
+    else:
+        file = io.BytesIO(request.getfixturevalue('lif_bytes'))
 
     with LifFile(file, mode='r+b', squeeze=True) as lif:
-        str(lif)
+        if __debug__:
+            str(lif)
         assert lif.parent is None
         if filetype is str:
-            assert lif.filename == str(filename.name)
-            assert lif.dirname == str(filename.parent)
+            assert lif.filename == os.path.basename(filename)
+            assert lif.dirname == os.path.dirname(filename)
         else:
             assert lif.filename == ''
         assert not lif.filehandle.closed
         assert lif.name == 'ScanModiBeispiele.lif'
         assert lif.version == 2
         assert lif.uuid == '9da018ae-5b2b-11e3-8f53-eccd6d2154b5'
-        assert lif.datetime == datetime.datetime(
-            2013, 12, 2, 8, 27, 44, tzinfo=datetime.UTC
-        )
+        assert lif.datetime == SCANMODES_DATETIME
         assert len(lif.memory_blocks) == 240
         assert isinstance(lif.xml_element, ElementTree.Element)
+        assert lif.xml_element is lif.xml_element
         assert repr(lif).startswith('<LifFile ')
         assert lif.xml_header().startswith(
             '<LMSDataContainerHeader Version="2">'
         )
 
         series = lif.images
-        str(series)
+        if __debug__:
+            str(series)
         assert isinstance(series, LifImageSeries)
         assert len(series) == 200
         with pytest.raises(IndexError):
@@ -919,12 +223,15 @@ def test_lif(filetype):
             lif.images['ABC']
 
         for image in series:
-            str(image)
+            if __debug__:
+                str(image)
             assert isinstance(image, LifImageABC)
             assert isinstance(image, LifImage)
 
         images = series.findall('XZEXcLambda/Lambda.*', flags=re.IGNORECASE)
         assert len(images) == 9
+        assert series.findall(LAMBDA_RE) == images
+        assert series[LAMBDA_RE] is images[0]
         assert images[0].name == 'Lambda_496nm'
         assert images[0].parent_image is None
 
@@ -933,7 +240,8 @@ def test_lif(filetype):
         assert series.find('ABC', default=im) is im
 
         im = series[5]
-        str(im)
+        if __debug__:
+            assert str(im) is str(im)
         assert series[im.path] is im
         assert series[im.name + '$'] is im
         assert im.parent is lif
@@ -948,17 +256,21 @@ def test_lif(filetype):
         assert im.shape == (7, 5, 2, 128, 128)
         assert im.dims == ('T', 'Z', 'C', 'Y', 'X')
         assert im.sizes == {'T': 7, 'Z': 5, 'C': 2, 'Y': 128, 'X': 128}
+        assert im.size == 1146880
+        assert im.nbytes == 1146880
+        assert im.ndim == 5
         assert 'C' not in im.coords
         assert_allclose(im.coords['T'][[0, -1]], [0.0, 10.657])
         assert_allclose(im.coords['Z'][[0, -1]], [4.999881e-06, -5.000359e-06])
         assert_allclose(im.coords['Y'][[0, -1]], [-3.418137e-05, 3.658182e-04])
         assert_allclose(im.coords['X'][[0, -1]], [8.673617e-20, 3.999996e-04])
         assert im.attrs['path'] == im.parent.name + '/' + im.path
+        assert im.timestamps is im.timestamps
         assert len(im.timestamps) == 70
-        assert im.timestamps[0] == numpy.datetime64('2013-12-02T09:49:26.347')
-        assert im.size == 1146880
-        assert im.nbytes == 1146880
-        assert im.ndim == 5
+        assert_array_equal(
+            im.timestamps[:1],
+            numpy.array(['2013-12-02T09:49:26.347'], dtype='datetime64[ms]'),
+        )
         assert isinstance(im.xml_element, ElementTree.Element)
 
         attrs = im.attrs['HardwareSetting']
@@ -980,12 +292,16 @@ def test_lif(filetype):
         assert_array_equal(xdata.coords['T'], im.coords['T'])
 
         memory_block = im.memory_block
-        str(im.memory_block)
+        if __debug__:
+            str(im.memory_block)
         assert isinstance(memory_block, LifMemoryBlock)
         assert memory_block.id == 'MemBlock_29'
         assert memory_block.offset == 6639225
         assert memory_block.size == 1146880
-        assert memory_block.read() == data.tobytes()
+        assert_array_equal(
+            numpy.frombuffer(memory_block.read(), numpy.uint8),
+            data.view(numpy.uint8).ravel(),
+        )
 
         if filetype is str:
             lif.close()
@@ -998,8 +314,24 @@ def test_lif(filetype):
             lif = LifFile(file, mode='abc')
 
 
+@pytest.mark.parametrize('maxworkers', [1, 4])
+def test_read_all(maxworkers):
+    """Test LifFile.read_all method."""
+    pytest.importorskip('xarray')
+    with LifFile(SCANMODES_LIF) as lif:
+        data = lif.read_all(maxworkers=maxworkers)
+        assert list(data) == [image.path for image in lif.images]
+        for image in itertools.islice(lif.images, 0, None, 20):
+            xdata = data[image.path]
+            assert xdata.dims == image.dims
+            assert_array_equal(xdata.data, image.asarray())
+        with pytest.raises(ValueError):
+            lif.read_all(maxworkers=maxworkers, out=numpy.empty(1))
+
+
 def test_lof():
     """Test LOF file."""
+    xarray = pytest.importorskip('xarray')
     filename = (
         DATA
         / 'XLEFReaderForBioformats'
@@ -1059,7 +391,10 @@ def test_lof():
         assert_allclose(im.coords['X'][[0, -1]], [0.0, 0.00163707], atol=1e-4)
         assert im.attrs['path'] == im.path
         assert len(im.timestamps) == 24
-        assert im.timestamps[0] == numpy.datetime64('2021-12-10T11:53:16.792')
+        assert_array_equal(
+            im.timestamps[:1],
+            numpy.array(['2021-12-10T11:53:16.792'], dtype='datetime64[ms]'),
+        )
         assert im.size == 46080000
         assert im.nbytes == 46080000
         assert im.ndim == 5
@@ -1088,7 +423,10 @@ def test_lof():
         assert memory_block.id == 'MemBlock_1199'
         assert memory_block.offset == 62
         assert memory_block.size == 46080000
-        assert memory_block.read() == data.tobytes()
+        assert_array_equal(
+            numpy.frombuffer(memory_block.read(), numpy.uint8),
+            data.view(numpy.uint8).ravel(),
+        )
 
 
 @pytest.mark.parametrize(
@@ -1104,6 +442,7 @@ def test_lof():
 )
 def test_xlif(name):
     """Test XLIF file."""
+    xarray = pytest.importorskip('xarray')
     filename = (
         DATA
         / 'Leica_Image_File_Format Examples_2015_08'
@@ -1169,7 +508,10 @@ def test_xlif(name):
         )
         assert im.attrs['path'] == im.path
         assert len(im.timestamps) == 20
-        assert im.timestamps[0] == numpy.datetime64('2015-01-27T10:14:30.304')
+        assert_array_equal(
+            im.timestamps[:1],
+            numpy.array(['2015-01-27T10:14:30.304'], dtype='datetime64[ms]'),
+        )
         assert im.size == 5242880
         assert im.nbytes == 5242880
         assert im.ndim == 4
@@ -1199,12 +541,16 @@ def test_xlif(name):
         assert memory_block.id == ''
         assert memory_block.offset == -1
         assert memory_block.size == 5242880
-        assert memory_block.read() == data.tobytes()
+        assert_array_equal(
+            numpy.frombuffer(memory_block.read(), numpy.uint8),
+            data.view(numpy.uint8).ravel(),
+        )
 
 
 @pytest.mark.parametrize('name', ['LOF', 'TIF'])
 def test_xlif_lof(name):
     """Test XLIF file referencing LOF."""
+    xarray = pytest.importorskip('xarray')
     filename = (
         DATA
         / 'XLEFReaderForBioformats/rgb channel test'
@@ -1219,6 +565,9 @@ def test_xlif_lof(name):
         xdata = xlif.images[0].asxarray(mode='r', out='memmap')
         assert isinstance(xdata, xarray.DataArray)
         assert isinstance(xdata.data, numpy.memmap), type(xdata.data)
+        if name == 'LOF':
+            # image data are mapped directly from LOF file
+            assert xdata.data.filename.endswith('.lof')
         assert xdata.name == 'z then lambda'
         assert xdata.dtype == numpy.uint8
         assert xdata.sizes == {
@@ -1240,6 +589,7 @@ def test_xlif_lof(name):
 @pytest.mark.parametrize('name', ['LOF', 'TIF'])
 def test_xlef(name):
     """Test XLEF file with XLIF and XLCF children."""
+    xarray = pytest.importorskip('xarray')
     if name == 'LOF':
         name = 'XLEF-LOF Snail/Schnecke.xlef'
     else:
@@ -1306,13 +656,17 @@ def test_xlef(name):
         rgb = data.sum(dtype=numpy.uint64, axis=(0, 1)).tolist()
         assert rgb == [146107764, 141298533, 133919392]
 
-        xdata = im.asxarray()
+        # read into existing array
+        out = numpy.empty(im.shape, im.dtype)
+        xdata = im.asxarray(out=out)
         assert isinstance(xdata, xarray.DataArray)
+        assert numpy.shares_memory(xdata.data, out)
         assert_array_equal(xdata.data, data)
 
 
 def test_lifext():
     """Test LIFEXT file."""
+    xarray = pytest.importorskip('xarray')
     filename = str(DATA / 'XLEFReaderForBioformats/dimension tests LIFs/XYZCS')
 
     with (
@@ -1396,38 +750,93 @@ def test_lifext():
         assert memory_block.id == 'MemBlock_838'
         assert memory_block.offset == 19222545
         assert memory_block.size == 4800000
-        assert memory_block.read() == data.tobytes()
+        assert_array_equal(
+            numpy.frombuffer(memory_block.read(), numpy.uint8),
+            data.view(numpy.uint8).ravel(),
+        )
+
+
+@pytest.fixture(scope='session')
+def scanmodes_lif():
+    """Return images in ScanModesExamples.lif memory-mapped once per session.
+
+    Session fixtures are created once per process, that is, once per
+    pytest-xdist worker.
+
+    """
+    with (
+        open(SCANMODES_LIF, 'rb') as fh,
+        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        LifFile(mm, squeeze=False) as lif,
+    ):
+        yield lif.images
+
+
+@pytest.fixture(scope='session')
+def scanmodes_lif_squeezed():
+    """Return squeezed images in ScanModesExamples.lif parsed once."""
+    with (
+        open(SCANMODES_LIF, 'rb') as fh,
+        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        LifFile(mm) as lif,
+    ):
+        yield lif.images
 
 
-@pytest.mark.parametrize('index', range(len(SCANMODES)))
-def test_scan_modes(index):
+@pytest.fixture(scope='session')
+def out_pool():
+    """Return function returning reusable output array of shape and dtype."""
+    cache = {}
+
+    def get(shape, dtype):
+        key = (shape, numpy.dtype(dtype).str)
+        if key not in cache:
+            cache[key] = numpy.empty(shape, dtype)
+        return cache[key]
+
+    return get
+
+
+@pytest.mark.parametrize('index', range(len(SCANMODES)), ids=SCANMODES_PATHS)
+def test_scan_modes(index, scanmodes_lif, scanmodes_lif_squeezed, out_pool):
     """Test scan modes."""
-    filename = DATA / 'ScanModesExamples.lif'
     path, sizes, dtype = SCANMODES[index]
     shape = tuple(sizes.values())
-    with LifFile(filename, squeeze=False) as lif:
-        image = lif.images[index]
-        assert image.path == path
-        assert image.sizes == sizes
-        assert image.shape == shape
-        assert image.dtype == dtype
-        assert image.timestamps is not None
-        data = image.asxarray()
-        assert data.shape == shape
-        assert data.dtype == dtype
+    image = scanmodes_lif[path]
+    assert image is scanmodes_lif[index]
+    assert image.path == path
+    assert image_attrs(image) == expected_attrs(sizes, dtype)
+    assert image.timestamps is not None
+    data = image.asxarray(out=out_pool(shape, dtype))
+    assert data.shape == shape
+    assert data.dtype == dtype
 
     if 1 in sizes.values():
         sizes = {k: v for k, v in sizes.items() if v > 1}
         shape = tuple(sizes.values())
-        with LifFile(filename) as lif:
-            image = lif.images[index]
-            assert image.path == path
-            assert image.sizes == sizes
-            assert image.shape == shape
-            assert image.dtype == dtype
-            data = image.asxarray()
-            assert data.shape == shape
-            assert data.dtype == dtype
+        image = scanmodes_lif_squeezed[path]
+        assert image.path == path
+        assert image_attrs(image) == expected_attrs(sizes, dtype)
+        data = image.asxarray(out=out_pool(shape, dtype))
+        assert data.shape == shape
+        assert data.dtype == dtype
+
+
+def test_scan_modes_sizes(scanmodes_lif):
+    """Test query of scan mode images by dimension size."""
+    # sizes of all dimension labels, 0 if missing
+    labels = sorted({dim for _, sizes, _ in SCANMODES for dim in sizes})
+    sizes = numpy.array(
+        [[s.get(dim, 0) for dim in labels] for _, s, _ in SCANMODES]
+    )
+    index = labels.index('Λ')
+    paths = [
+        SCANMODES_PATHS[i] for i in numpy.nonzero(sizes[:, index] == 10)[0]
+    ]
+    assert len(paths) == 32
+    assert paths == [
+        image.path for image in scanmodes_lif if image.sizes.get('Λ') == 10
+    ]
 
 
 @pytest.mark.parametrize(
@@ -1668,11 +1077,19 @@ def test_rgb():
             data.sum(dtype=numpy.uint64, axis=(0, 1, 2)),
             [12387812, 9225469, 82284132],
         )
+        # sum samples in one pass over memory-mapped file
+        data = image.asarray(out='memmap')
+        assert_array_equal(
+            numpy.add.reduce(data.reshape(-1, 3), axis=0, dtype=numpy.uint64),
+            [12387812, 9225469, 82284132],
+        )
 
         image = lif.images[1]
         assert image.sizes == {'Y': 1536, 'X': 2048, 'S': 3}
         data = image.asarray()
         assert data.sum(dtype=numpy.uint64) == 86724120
+        data = image.asarray(out='memmap')
+        assert data.sum(dtype=numpy.uint64) == 86724120
 
 
 def test_rgb_pad():
@@ -1795,7 +1212,7 @@ def test_phasor_from_lif():
     # assert 'frequency' not in attrs
 
     # file does not contain FLIM data
-    filename = DATA / 'ScanModesExamples.lif'
+    filename = SCANMODES_LIF
     with pytest.raises(ValueError):
         phasor_from_lif(filename)
 
@@ -1804,7 +1221,7 @@ def test_signal_from_lif():
     """Test PhasorPy signal_from_lif function."""
     from phasorpy.io import signal_from_lif
 
-    filename = DATA / 'ScanModesExamples.lif'
+    filename = SCANMODES_LIF
     signal = signal_from_lif(filename)
     assert signal.dims == ('C', 'Y', 'X')
     assert signal.shape == (9, 128, 128)
@@ -1846,6 +1263,15 @@ def test_case_sensitive_path(path, name):
     ) == str(DATA / 'case_sensitive/FLIM_testdata/FLIM_testdata.xlef')
 
 
+def test_compile_pattern():
+    """Test compile_pattern function."""
+    pattern = compile_pattern('xyz.*', re.IGNORECASE)
+    assert pattern.flags & re.IGNORECASE
+    assert pattern.search('ABC/XYZT') is not None
+    assert compile_pattern('xyz.*', re.IGNORECASE) is pattern
+    assert compile_pattern('xyz.*') is not pattern
+
+
 def test_xml2dict():
     """Test xml2dict function."""
     xml = ElementTree.fromstring(
@@ -1857,6 +1283,7 @@ def test_xml2dict():
         <floats>1.0, -2.0</floats>
         <bool>True</bool>
         <string>Lorem, Ipsum</string>
+        <repeat attr="-1,2">-1,2</repeat>
     </root>
     """
     )
@@ -1868,10 +1295,12 @@ def test_xml2dict():
     assert d['floats'] == (1.0, -2.0)
     assert d['bool'] is True
     assert d['string'] == 'Lorem, Ipsum'
+    assert d['repeat'] == {'attr': (-1, 2), 'value': (-1, 2)}
 
     d = xml2dict(xml, prefix=('a_', 'b_'), sep='')['root']
     assert d['ints'] == '-1,2'
     assert d['floats'] == '1.0, -2.0'
+    assert d['repeat'] == {'a_attr': '-1,2', 'b_value': '-1,2'}
 
 
 @pytest.mark.skipif(
@@ -1913,7 +1342,9 @@ def test_glob(fname):
                 image.asxarray()
             image.timestamps
             with pytest.warns(DeprecationWarning):
-                image.xml_element_smd
+                smd = image.xml_element_smd
+            with pytest.warns(DeprecationWarning):
+                assert image.xml_element_smd is smd
 
 
 if __name__ == '__main__':